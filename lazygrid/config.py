@@ -32,3 +32,7 @@ insert_model_stmt = '''INSERT INTO MODEL(
 
 query_model_stmt = '''SELECT * FROM MODEL
                       WHERE train=? AND features=? AND parameters=? AND ids=?'''
+
+# Seconds a connection waits for a lock held by another process
+# (e.g. cross-validation folds fitted in parallel) before raising
+database_timeout = 60.0
@@ -20,6 +20,8 @@ import sqlite3
 from typing import Optional, Any, Iterable
 import logging
 
+from .config import database_timeout
+
 
 def _save_to_db(db_name: str, entry: Iterable, query: Iterable,
                 create_stmt: str, insert_stmt: str, query_stmt: str) -> Optional[Any]:
@@ -54,7 +56,7 @@ def _save_to_db(db_name: str, entry: Iterable, query: Iterable,
     root_dir = os.path.dirname(db_name)
     if not os.path.isdir(root_dir) and root_dir:
         os.makedirs(root_dir, exist_ok=True)
-    db = sqlite3.connect(db_name)
+    db = sqlite3.connect(db_name, timeout=database_timeout)
     cursor = db.cursor()
     db.execute(create_stmt)
 
@@ -100,12 +102,13 @@ def _load_from_db(db_name: str, query: Iterable, create_stmt: str, query_stmt: s
     root_dir = os.path.dirname(db_name)
     if not os.path.isdir(root_dir) and root_dir:
         os.makedirs(root_dir, exist_ok=True)
-    db = sqlite3.connect(db_name)
+    db = sqlite3.connect(db_name, timeout=database_timeout)
     cursor = db.cursor()
     db.execute(create_stmt)
 
     result = cursor.execute(query_stmt, query).fetchone()
     cursor.close()
+    db.close()
 
     return result
 
@@ -134,7 +137,7 @@ def load_all_from_db(db_name: str, table_name: str = "MODEL") -> Optional[Any]:
     root_dir = os.path.dirname(db_name)
     if not os.path.isdir(root_dir) and root_dir:
         os.makedirs(root_dir, exist_ok=True)
-    db = sqlite3.connect(db_name)
+    db = sqlite3.connect(db_name, timeout=database_timeout)
     cursor = db.cursor()
 
     stmt = '''SELECT name FROM sqlite_master WHERE type='table' AND name=? '''
@@ -146,6 +149,7 @@ def load_all_from_db(db_name: str, table_name: str = "MODEL") -> Optional[Any]:
     query_stmt = '''SELECT * FROM %s''' % table_name
     result = cursor.execute(query_stmt).fetchall()
     cursor.close()
+    db.close()
 
     return result
 
@@ -172,7 +176,7 @@ def drop_db(db_name: str) -> None:
     root_dir = os.path.dirname(db_name)
     if not os.path.isdir(root_dir) and root_dir:
         os.makedirs(root_dir, exist_ok=True)
-    db = sqlite3.connect(db_name)
+    db = sqlite3.connect(db_name, timeout=database_timeout)
     cursor = db.cursor()
 
     cursor.execute("DROP TABLE IF EXISTS MODEL")
@@ -21,6 +21,7 @@ from typing import Tuple, List, Iterator, Iterable
 import copy
 from keras import Model
 from keras.wrappers.scikit_learn import KerasClassifier
+from sklearn.base import clone
 from sklearn.pipeline import Pipeline
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.svm import SVC
@@ -87,22 +88,17 @@ def generate_grid(elements: list, lazy: bool = True, **kwargs) -> list:
     assert isinstance(elements, list)
     assert all([isinstance(step, list) for step in elements])
 
-    # generate all possible combinations of steps
-    subsets = []
-    for step_list in product(*elements):
-        for steps in _powerset(step_list):
-            if len(steps) > 0:
-                if steps[-1] == step_list[-1]:
-                    subsets.append(steps)
+    # generate all possible combinations of steps ending with the final element
+    subsets = (steps + step_list[-1:]
+               for step_list in product(*elements) if step_list
+               for steps in _powerset(step_list[:-1]))
 
     pipelines = []
     for subset in subsets:
-        # create list of tuples (step_name, step_object) to feed sklearn Pipeline
-        i = 0
-        steps = []
-        for step in subset:
-            steps.append(("step_" + str(i), copy.deepcopy(step)))
-            i += 1
+        # create list of tuples (step_name, step_object) to feed sklearn Pipeline;
+        # sklearn steps only need their hyper-parameters copied
+        steps = [("step_" + str(i), clone(step) if hasattr(step, "get_params") else copy.deepcopy(step))
+                 for i, step in enumerate(subset)]
 
         if lazy:
             pipeline = LazyPipeline(steps, **kwargs)
@@ -186,13 +182,11 @@ def generate_grid_search(model: KerasClassifier, model_params: dict,
     # generate all possible combinations of parameters
     for values_list in product(*values):
 
-        learner = copy.deepcopy(model)
-
         # uniquely define model structure
         model_params_values = [values_list[i] for i in range(0, len(values_list)) if is_for_fit[i] is False]
         model_params_keys = [keys[i] for i in range(0, len(keys)) if is_for_fit[i] is False]
         model_params_dict = dict(zip(model_params_keys, model_params_values))
-        learner = learner.build_fn(**model_params_dict)
+        learner = model.build_fn(**model_params_dict)
 
         # uniquely define fit function
         fit_params_values = [values_list[i] for i in range(0, len(values_list)) if is_for_fit[i] is True]
@@ -15,7 +15,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import json
 import os
 import pickle
@@ -151,8 +150,8 @@ class LazyPipeline(Pipeline):
         Xnp, ynp = check_X_y(X, y)
         self._validate_steps()
 
-        self.train_ = tuple(X.index)
-        self.features_ = tuple(X.columns)
+        self.train_ = tuple(X.index.tolist())
+        self.features_ = tuple(X.columns.tolist())
         self.database_ = os.path.join(self.database, "database.sqlite")
         self.fit_params_ = fit_params
         self._fit(X, y, **fit_params)
@@ -166,22 +165,23 @@ class LazyPipeline(Pipeline):
         # fit or load intermediate steps
         for (step_idx, name, transformer) in self._iter(with_final=False, filter_passthrough=False):
             transformer, ids, Xt = self._fit_step(transformer, ids, False, Xt, y, **fit_params)
-            self.steps[step_idx] = (name, copy.deepcopy(transformer))
+            self.steps[step_idx] = (name, transformer)
 
         # fit or load final step
         transformer, ids, Xt = self._fit_step(self.steps[-1][1], ids, True, Xt, y, **fit_params)
-        self.steps[-1] = (self.steps[-1][0], copy.deepcopy(transformer))
+        self.steps[-1] = (self.steps[-1][0], transformer)
 
         return self
 
     def _fit_step(self, transformer: BaseEstimator, ids: Tuple, is_final: bool,
                   X: pd.DataFrame, y: Iterable = None, **fit_params):
         # make transformer unique for each CV split
-        transformer.train_ = tuple(X.index)
-        transformer.features_ = tuple(X.columns)
+        transformer.train_ = tuple(X.index.tolist())
+        transformer.features_ = tuple(X.columns.tolist())
 
         # load transformer from database
-        transformer_loaded, ids_loaded = self._load(transformer, ids)
+        query = _step_query(transformer, ids)
+        transformer_loaded, ids_loaded = self._load(query, ids)
         is_loaded = False if transformer_loaded is None else True
         if is_loaded:
             transformer = transformer_loaded
@@ -215,19 +215,22 @@ class LazyPipeline(Pipeline):
 
         # save transformer
         if not is_loaded:
-            ids = self._save(transformer, ids)
+            ids = self._save(transformer, query, ids)
 
         return transformer, ids, X
 
-    def _save(self, transformer: BaseEstimator, ids: Tuple):
-        query, entry = _step_db(transformer, ids)
+    def _save(self, transformer: BaseEstimator, query: Tuple, ids: Tuple):
+        transformer.is_fitted_ = True
+        entry = (
+            *query,
+            pickle.dumps(transformer),
+        )
         result = _save_to_db(self.database_, entry, query, create_model_stmt, insert_model_stmt, query_model_stmt)
         if result:
             ids = ids + (result[0],)
         return ids
 
-    def _load(self, transformer: BaseEstimator, ids: Tuple):
-        query, entry = _step_db(transformer, ids)
+    def _load(self, query: Tuple, ids: Tuple):
         result = _load_from_db(self.database_, query, create_model_stmt, query_model_stmt)
         if result:
             ids = ids + (result[0],)
@@ -238,23 +241,25 @@ class LazyPipeline(Pipeline):
             return None, None
 
 
-def _step_db(estimator: BaseEstimator, ids: Tuple):
-    estimator.is_fitted_ = True
-    # make a dictionary of parameters
-    pms = ()
+def _step_query(estimator: BaseEstimator, ids: Tuple):
+    # make a list of parameters
+    pms = []
     estimator_params = estimator.get_params()
-    for key in sorted(estimator_params.keys()):
-        value = estimator_params[key]
-        if isinstance(value, Callable):
-            pms = pms + (key, value.__name__)
+    for key, value in sorted(estimator_params.items()):
+        # plain values are always json serializable
+        if value is None or isinstance(value, (str, int, float)):
+            if value == "warn":
+                pms.extend((key, 10))
+            pms.extend((key, value))
+            continue
 
-        if value == "warn":
-            pms = pms + (key, 10)
+        if isinstance(value, Callable):
+            pms.extend((key, value.__name__))
 
         # discard parameters which are not json serializable
         try:
             json.dumps(value)
-            pms = pms + (key, value)
+            pms.extend((key, value))
         except TypeError:
             continue
 
@@ -264,9 +269,5 @@ def _step_db(estimator: BaseEstimator, ids: Tuple):
         json.dumps(pms),
         json.dumps(ids),
     )
-    entry = (
-        *query,
-        pickle.dumps(estimator),
-    )
 
-    return query, entry
+    return query
@@ -24,7 +24,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
-def plot_boxplots(scores: List, labels: List[str], file_name: str, title: str, output_dir: str = "./figures") -> dict:
+def plot_boxplots(scores: List, labels: List[str], file_name: str, title: str,
+                  output_dir: str = "./figures", dpi: int = 300) -> dict:
     """
     Generate and save boxplots.
 
@@ -40,6 +41,8 @@ def plot_boxplots(scores: List, labels: List[str], file_name: str, title: str, o
         Figure title
     output_dir
         Output directory
+    dpi
+        Resolution of the saved figure in dots per inch
 
     Returns
     -------
@@ -51,13 +54,12 @@ def plot_boxplots(scores: List, labels: List[str], file_name: str, title: str, o
     if not os.path.isdir(output_dir):
         os.mkdir(output_dir)
 
-    cv = np.stack(scores, axis=1)
-
     plt.figure()
-    results = plt.boxplot(cv, notch=True, labels=labels)
+    # one box per score list, also when scores is a 2-D array
+    results = plt.boxplot([np.asarray(score) for score in scores], notch=True, labels=labels)
     plt.title(title)
     plt.tight_layout()
-    plt.savefig(file_name, dpi=800)
+    plt.savefig(file_name, dpi=dpi)
     plt.show()
 
     return results
@@ -64,9 +64,11 @@ def confidence_interval_mean_t(x: np.ndarray, cl: float = 0.05) -> List:
     which means it has relatively more scores in its tails than does the normal distribution.
     As a result, you have to extend farther from the mean to contain a given proportion of the area.
     """
-    if np.all(x == np.mean(x)):
-        return [np.mean(x), np.mean(x)]
-    bounds = stats.t.interval(1-cl, len(x)-1, loc=np.mean(x), scale=stats.sem(x))
+    x = np.asarray(x, dtype=np.float64)
+    mean = np.mean(x)
+    if np.all(x == mean):
+        return [mean, mean]
+    bounds = stats.t.interval(1-cl, len(x)-1, loc=mean, scale=stats.sem(x))
     adjusted_bounds = [bound if bound <= 1 else 1 for bound in bounds]
     return adjusted_bounds
 
@@ -128,28 +130,17 @@ def find_best_solution(solutions: list,
     [0.4782..., 0.0360..., 0.1610...]
     """
 
-    best_idx = 0
-    best_solution = solutions[best_idx]
-    best_mean = np.mean(best_solution)
-
     # find the best solution (the one having the highest mean value)
-    index = 1
-    for solution in solutions[index:]:
-        solution_mean = np.mean(solution)
-
-        if solution_mean > best_mean:
-            best_solution = solution
-            best_mean = np.mean(best_solution)
-            best_idx = index
-
-        index += 1
+    # candidates that failed on a fold score NaN and are never the best one
+    means = np.array([np.mean(solution) for solution in solutions])
+    best_idx = 0 if np.all(np.isnan(means)) else int(np.nanargmax(means))
+    best_solution = solutions[best_idx]
 
     best_solutions_idx = []
     pvalues = []
 
     # check if there are other candidates which may be equivalent to the best one
-    index = 0
-    for solution in solutions:
+    for index, solution in enumerate(solutions):
         try:
             statistic, pvalue = test(best_solution, solution, **kwargs)
         except ValueError:
@@ -159,8 +150,6 @@ def find_best_solution(solutions: list,
             best_solutions_idx.append(index)
         pvalues.append(pvalue)
 
-        index += 1
-
     return best_idx, best_solutions_idx, pvalues
 
 
@@ -181,11 +170,13 @@ def tp(y_true, y_pred):
 
 
 def specificity(y_true, y_pred):
-    return tn(y_true, y_pred) / (tn(y_true, y_pred) + fp(y_true, y_pred))
+    cm = confusion_matrix(y_true, y_pred)
+    return cm[0, 0] / (cm[0, 0] + cm[0, 1])
 
 
 def sensitivity(y_true, y_pred):
-    return tp(y_true, y_pred) / (tp(y_true, y_pred) + fn(y_true, y_pred))
+    cm = confusion_matrix(y_true, y_pred)
+    return cm[1, 1] / (cm[1, 1] + cm[1, 0])
 
 
 scoring_summary = {'tp': make_scorer(tp), 'tn': make_scorer(tn),
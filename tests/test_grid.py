@@ -21,6 +21,10 @@ class TestGrid(unittest.TestCase):
         pipelines = grid.generate_grid(elements, lazy=False)
         lazy_pipelines = grid.generate_grid(elements)
 
+        # 8 combinations of steps, each with 4 subsets ending with the classifier
+        self.assertEqual(len(pipelines), 32)
+        self.assertEqual(len(lazy_pipelines), 32)
+
         for pipeline in lazy_pipelines:
             self.assertTrue(isinstance(pipeline, lazy_estimator.LazyPipeline))
         for pipeline in pipelines:
@@ -85,6 +85,72 @@ class TestLazyEstimator(unittest.TestCase):
         self.assertEqual(len(s1["estimator"]), 10)
         self.assertEqual(len(s2["estimator"]), 10)
 
+    def test_array_valued_parameters(self):
+
+        from sklearn import svm
+        from sklearn.datasets import make_classification
+        from sklearn.preprocessing import KBinsDiscretizer
+        from lazygrid.lazy_estimator import LazyPipeline
+        from lazygrid.database import load_all_from_db, drop_db
+        import numpy as np
+        import os
+        import pandas as pd
+
+        db_dir = "./db/array_parameters/"
+        db_name = os.path.join(db_dir, "database.sqlite")
+        drop_db(db_name)
+
+        X, y = make_classification(n_features=2, n_informative=2, n_redundant=0, random_state=42)
+        X = pd.DataFrame(X)
+
+        # array parameters are not json serializable and must be skipped
+        discretizer = KBinsDiscretizer(n_bins=np.array([3, 4]), encode="ordinal")
+        le = LazyPipeline([('kbins', discretizer), ('svc', svm.SVC(random_state=42))], database=db_dir)
+        le.fit(X, y)
+        le.fit(X, y)
+
+        self.assertEqual(len(load_all_from_db(db_name)), 2)
+
+    def test_step_query_is_unchanged(self):
+
+        from sklearn import svm
+        from sklearn.feature_selection import SelectKBest, f_classif
+        from lazygrid.lazy_estimator import _step_query
+        from typing import Callable
+        import json
+
+        # database keys as built before the parameter scan was rewritten
+        def legacy_step_query(estimator, ids):
+            pms = ()
+            estimator_params = estimator.get_params()
+            for key in sorted(estimator_params.keys()):
+                value = estimator_params[key]
+                if isinstance(value, Callable):
+                    pms = pms + (key, value.__name__)
+
+                if value == "warn":
+                    pms = pms + (key, 10)
+
+                try:
+                    json.dumps(value)
+                    pms = pms + (key, value)
+                except TypeError:
+                    continue
+
+            return (
+                json.dumps(estimator.train_),
+                json.dumps(estimator.features_),
+                json.dumps(pms),
+                json.dumps(ids),
+            )
+
+        for estimator in [SelectKBest(f_classif, k=5), svm.SVC(kernel='linear', random_state=42)]:
+            estimator.train_ = tuple(range(10))
+            estimator.features_ = tuple(range(3))
+            ids = (1, 2)
+
+            self.assertEqual(_step_query(estimator, ids), legacy_step_query(estimator, ids))
+
 
 suite = unittest.TestLoader().loadTestsFromTestCase(TestLazyEstimator)
 unittest.TextTestRunner(verbosity=2).run(suite)
@@ -20,6 +20,10 @@ class TestStatistics(unittest.TestCase):
 
         self.assertAlmostEqual(l_bound, -0.1383, places=4)
         self.assertEqual(u_bound, 1)
+
+        # constant plain lists of scores collapse to their mean
+        bounds = lg.statistics.confidence_interval_mean_t(10 * [0.5], confidence_level)
+        self.assertEqual(bounds, [0.5, 0.5])
         
     def test_find_best_solution(self):
         
@@ -52,6 +56,22 @@ class TestStatistics(unittest.TestCase):
         self.assertAlmostEqual(pvalues[1], 0.0926, places=4)
         self.assertAlmostEqual(pvalues[2], 0.1611, places=4)
 
+    def test_find_best_solution_nan(self):
+
+        import numpy as np
+        import lazygrid as lg
+
+        np.random.seed(42)
+        score1 = np.random.normal(loc=0.7, scale=0.05, size=10)
+        score2 = np.array(10 * [np.nan])
+        score3 = np.random.normal(loc=0.9, scale=0.05, size=10)
+
+        best_idx, best_solutions_idx, pvalues = lg.statistics.find_best_solution([score1, score2, score3])
+        self.assertEqual(best_idx, 2)
+
+        best_idx, best_solutions_idx, pvalues = lg.statistics.find_best_solution([score2, score1])
+        self.assertEqual(best_idx, 1)
+
     def test_find_best_solution_pipelines(self):
 
         from sklearn.ensemble import RandomForestClassifier